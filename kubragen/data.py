@@ -139,15 +139,28 @@ def DataClean(data: Any, in_place: bool = True) -> Any:
     """
     if not in_place:
         data = copy.deepcopy(data)
-    if isinstance(data, MutableMapping):
-        keylist = list(data.keys())
-        for key in keylist:
-            DataCleanProp(data, key)
-        for item in data.values():
-            DataClean(item)
-    elif isinstance(data, MutableSequence):
-        for key in range(len(data) - 1, -1, -1):
-            DataCleanProp(data, key)
-        for item in data:
-            DataClean(item)
+    # walk the containers using an explicit stack instead of recursion
+    stack = [data]
+    while stack:
+        current = stack.pop()
+        t = type(current)
+        if t is dict or (t is not list and isinstance(current, MutableMapping)):
+            # same as DataCleanProp, inlined to avoid a function call per key
+            for key in tuple(current):
+                value = current[key]
+                if isinstance(value, Data):
+                    if not value.is_enabled():
+                        del current[key]
+                    else:
+                        current[key] = value.get_value()
+            stack.extend(current.values())
+        elif t is list or isinstance(current, MutableSequence):
+            for key in range(len(current) - 1, -1, -1):
+                value = current[key]
+                if isinstance(value, Data):
+                    if not value.is_enabled():
+                        del current[key]
+                    else:
+                        current[key] = value.get_value()
+            stack.extend(current)
     return DataGetValue(data)
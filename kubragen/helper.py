@@ -43,6 +43,9 @@ class LiteralStr(HelperStr):
     pass
 
 
+_HELPER_STR_TYPES = frozenset([QuotedStr, SingleQuotedStr, DoubleQuotedStr, FoldedStr, LiteralStr])
+
+
 def HelperStrNewInstance(base: HelperStr, value: str) -> HelperStr:
     """
     Returns a new :class:`HelperStr` instance of the same type as the base.
@@ -53,6 +56,10 @@ def HelperStrNewInstance(base: HelperStr, value: str) -> HelperStr:
     :return: The value wrapped by the type of base
     :raises: :class:`kubragen.exception.InvalidParamError`
     """
+    tbase = type(base)
+    if tbase in _HELPER_STR_TYPES:
+        return tbase(value)
+    # subclasses are returned as the helper class they inherit from
     if isinstance(base, QuotedStr):
         return QuotedStr(value)
     elif isinstance(base, SingleQuotedStr):
@@ -1,4 +1,4 @@
-from typing import Any, Optional, Union, Sequence, Dict, Mapping, Callable
+from typing import Any, Optional, Union, Sequence, Dict, Mapping, Callable, FrozenSet, Tuple
 
 from jsonpatch import InvalidJsonPatch  # type: ignore
 
@@ -14,6 +14,8 @@ class ObjectFilterBase:
     """
     Base class for object filters
     """
+    __slots__ = ()
+
     def is_include(self, object: ObjectItem) -> bool:
         """
         Checks if the object should be included on the filter.
@@ -24,6 +26,12 @@ class ObjectFilterBase:
         return False
 
 
+def _filter_set(values: Optional[Sequence[str]]) -> Optional[FrozenSet[str]]:
+    if values is None:
+        return None
+    return frozenset(values)
+
+
 class ObjectFilter(ObjectFilterBase):
     """
     Object filter that filter by a list of object properties.
@@ -35,11 +43,20 @@ class ObjectFilter(ObjectFilterBase):
     :param instances: List of instances to include
     :param callables: List of callables to call and check for inclusion. **At least one** must return True
         to accept the object.
+
+    The lists are converted to sets when the filter is created, so they must not be changed afterwards.
     """
+    __slots__ = ('names', 'sources', 'instances', 'callables', '_names', '_sources', '_instances',
+                 '_object_checks')
+
     names: Optional[Sequence[str]]
     sources: Optional[Sequence[str]]
     instances: Optional[Sequence[str]]
     callables: Optional[Sequence[ObjectFilterCallable]]
+    _names: Optional[FrozenSet[str]]
+    _sources: Optional[FrozenSet[str]]
+    _instances: Optional[FrozenSet[str]]
+    _object_checks: Tuple[Tuple[str, FrozenSet[str]], ...]
 
     def __init__(self, names: Optional[Union[Sequence[str], str]] = None, sources: Optional[Union[Sequence[str], str]] = None,
                  instances: Optional[Union[Sequence[str], str]] = None,
@@ -60,20 +77,22 @@ class ObjectFilter(ObjectFilterBase):
             self.callables = [callables]
         else:
             self.callables = callables
+        self._names = _filter_set(self.names)
+        self._sources = _filter_set(self.sources)
+        self._instances = _filter_set(self.instances)
+        # only the object properties that are filtered need to be checked
+        self._object_checks = tuple((attr, values) for attr, values in (
+            ('name', self._names), ('source', self._sources), ('instance', self._instances),
+        ) if values is not None)
 
     def is_include(self, object: ObjectItem):
-        if not isinstance(object, Object) and (self.names is not None or self.sources is not None or
-                                               self.instances is not None):
-            # If is not an object but have object filters, it is impossible to check
-            return False
-
-        if isinstance(object, Object):
-            if self.names is not None and object.name not in self.names:
-                return False
-            if self.sources is not None and object.source not in self.sources:
-                return False
-            if self.instances is not None and object.instance not in self.instances:
+        if self._object_checks:
+            if not isinstance(object, Object):
+                # If is not an object but have object filters, it is impossible to check
                 return False
+            for attr, values in self._object_checks:
+                if getattr(object, attr) not in values:
+                    return False
 
         if self.callables is not None:
             for c in self.callables:
@@ -84,6 +103,9 @@ class ObjectFilter(ObjectFilterBase):
         return True
 
 
+_OBJECT_FILTER_KEYS = ('names', 'sources', 'instances', 'callables')
+
+
 def ObjectFilterFromDict(d: Mapping) -> ObjectFilter:
     """
     Build an object filter from a dict.
@@ -91,12 +113,23 @@ def ObjectFilterFromDict(d: Mapping) -> ObjectFilter:
     :param d: source dict
     :return: an :class:`ObjectFilter`
     """
-    if not any(name in d for name in ['names', 'sources', 'instances', 'callables']):
+    if not any(name in d for name in _OBJECT_FILTER_KEYS):
         raise InvalidParamError("Object filter dict must have at least one of 'names', 'sources', 'instances', 'callables'")
-    return ObjectFilter(names=d['names'] if 'names' in d else None,
-                        sources=d['sources'] if 'sources' in d else None,
-                        instances=d['instances'] if 'instances' in d else None,
-                        callables=d['callables'] if 'callables' in d else None)
+    return ObjectFilter(names=d.get('names'), sources=d.get('sources'), instances=d.get('instances'),
+                        callables=d.get('callables'))
+
+
+def _object_filter_check(filter: Any) -> ObjectFilterCallable:
+    """
+    Returns a function that checks the object using one filter.
+    """
+    if isinstance(filter, ObjectFilterBase):
+        return filter.is_include
+    elif isinstance(filter, Mapping):
+        return ObjectFilterFromDict(filter).is_include
+    elif callable(filter):
+        return filter
+    raise InvalidParamError('Unknown object filter type')
 
 
 def ObjectFilterCheck(object: ObjectItem, filters: Optional[Sequence[Any]]) -> bool:
@@ -110,20 +143,28 @@ def ObjectFilterCheck(object: ObjectItem, filters: Optional[Sequence[Any]]) -> b
     if filters is None:
         return True
     for filter in filters:
-        if isinstance(filter, ObjectFilterBase):
-            if filter.is_include(object):
-                return True
-        elif isinstance(filter, Mapping):
-            if ObjectFilterFromDict(filter).is_include(object):
-                return True
-        elif callable(filter):
-            if filter(object):
-                return True
-        else:
-            raise InvalidParamError('Unknown object filter type')
+        if _object_filter_check(filter)(object):
+            return True
     return False
 
 
+def _object_filter_predicate(filters: Optional[Sequence[Any]]) -> ObjectFilterCallable:
+    """
+    Builds a function that checks the object using the list of filters, the same as :func:`ObjectFilterCheck`.
+    Dict filters are converted to :class:`ObjectFilter` only once.
+    """
+    if filters is None:
+        return lambda object: True
+    checks = [_object_filter_check(filter) for filter in filters]
+
+    def predicate(object: ObjectItem) -> bool:
+        for check in checks:
+            if check(object):
+                return True
+        return False
+    return predicate
+
+
 ObjectFilterType = Union[
     ObjectFilterBase,
     Mapping[str, Union[Sequence[str], str]],
@@ -150,8 +191,11 @@ class FilterJSONPatch:
         * A callable that receives an :class:`kubragen.object.ObjectItem` as parameter and returns a bool whether the
           object should be included
     """
+    __slots__ = ('patches', '_filters', '_predicate')
+
     patches: Sequence[Any]
-    filters: Optional[Sequence[ObjectFilterType]]
+    _filters: Optional[Sequence[ObjectFilterType]]
+    _predicate: ObjectFilterCallable
 
     def __init__(self, filters: Optional[Union[Sequence[ObjectFilterType], ObjectFilterType]], patches: Sequence[Any]):
         if filters is not None and not isinstance(filters, Sequence):
@@ -160,6 +204,28 @@ class FilterJSONPatch:
             self.filters = filters
         self.patches = patches
 
+    @property
+    def filters(self) -> Optional[Sequence[ObjectFilterType]]:
+        """
+        The list of filters. When set, the filters are prepared for checking the objects, so
+        changing the list in-place afterwards has no effect.
+
+        :raises: :class:`kubragen.exception.InvalidParamError`
+        """
+        return self._filters
+
+    @filters.setter
+    def filters(self, filters: Optional[Sequence[ObjectFilterType]]) -> None:
+        self._filters = filters
+        self._predicate = _object_filter_predicate(filters)
+
+    def __getstate__(self):
+        # the predicate may be a closure, so it is rebuilt from the filters instead of pickled
+        return self._filters, self.patches
+
+    def __setstate__(self, state):
+        self.filters, self.patches = state
+
 
 FilterJSONPatches = Optional[Sequence[FilterJSONPatch]]
 
@@ -176,11 +242,12 @@ def JSONPatches_Apply(items: Union[Any, Sequence[Any]], jsonpatches: Sequence[An
     :raises: :class:`kubragen.exception.InvalidJsonPatchError`
     """
     try:
+        patch = KGJsonPatchExt(jsonpatches)
         if isinstance(items, Sequence):
             for item in items:
-                KGJsonPatchExt(jsonpatches).apply(item, in_place=True)
+                patch.apply(item, in_place=True)
         else:
-            KGJsonPatchExt(jsonpatches).apply(items, in_place=True)
+            patch.apply(items, in_place=True)
     except InvalidJsonPatch as e:
         raise InvalidJsonPatchError(str(e)) from e
     return items
@@ -199,10 +266,16 @@ def FilterJSONPatches_Apply(items: Sequence[ObjectItem], jsonpatches: FilterJSON
     """
     if jsonpatches is not None:
         try:
-            for item in items:
-                for jp in jsonpatches:
-                    if ObjectFilterCheck(item, jp.filters):
-                        KGJsonPatchExt(jp.patches).apply(item, in_place=True)
+            # each item still receives the patches in order, as items are patched independently
+            for jp in jsonpatches:
+                predicate = jp._predicate
+                patch = None
+                for item in items:
+                    if predicate(item):
+                        if patch is None:
+                            # the same patch object is reused for all the items it applies to
+                            patch = KGJsonPatchExt(jp.patches)
+                        patch.apply(item, in_place=True)
         except InvalidJsonPatch as e:
             raise InvalidJsonPatchError(str(e)) from e
     return items
@@ -1,17 +1,81 @@
 import copy
-from typing import Optional, Any, Sequence, Dict
+from types import MappingProxyType
+from typing import Optional, Any, Sequence, Dict, Mapping, Iterable, Tuple
 
 from kubragen.exception import InvalidParamError
 from kubragen.merger import Merger
 from kubragen.object import ObjectItem
 from kubragen.provider import Provider
-from kubragen.util import dict_get_value, dict_has_name
+from kubragen.util import dict_has_name, dict_try_get
+
+_MISSING = object()
+
+_CLONE_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def _clone(value: Any) -> Any:
+    """
+    Deep copy specialized for the plain dicts and lists of Kubernetes objects.
+    Any other type is copied using :func:`copy.deepcopy`.
+    """
+    t = type(value)
+    if t is dict:
+        return {k: _clone(v) for k, v in value.items()}
+    if t is list:
+        return [_clone(v) for v in value]
+    if t in _CLONE_IMMUTABLE_TYPES:
+        return value
+    return copy.deepcopy(value)
+
+
+def _filter_names(items: Mapping[str, Any], names: Sequence[str]) -> Iterable[Tuple[str, Any]]:
+    """Returns the items with the passed names, or all items if no names were passed, in the items order."""
+    if len(names) == 0:
+        return items.items()
+    names_set = frozenset(names)
+    return [(name, value) for name, value in items.items() if name in names_set]
+
+
+class _ProfileEntry:
+    """A persistent volume or persistent volume claim added to the resource database."""
+    __slots__ = ('profile', 'profile_resolved', 'config', 'merge_config')
+
+    def __init__(self, profile: str, config: Optional[Any], merge_config: Optional[Any]):
+        self.profile = profile
+        self.profile_resolved = None
+        self.config = config
+        self.merge_config = merge_config
+
+
+class _StorageClassEntry:
+    """A storage class added to the resource database."""
+    __slots__ = ('storageclass', 'config', 'merge_config')
+
+    def __init__(self, storageclass: 'KRStorageClass', config: Optional[Any], merge_config: Optional[Any]):
+        self.storageclass = storageclass
+        self.config = config
+        self.merge_config = merge_config
+
+
+def _profile_resolve(profiles: Mapping[str, Any], data: _ProfileEntry) -> Any:
+    """Looks up the profile builder of a resource and keeps it in the resource data for the next builds."""
+    profile = data.profile_resolved = profiles[data.profile]
+    return profile
+
+
+def _profile_resolved_reset(items: Mapping[str, _ProfileEntry], profile: str) -> None:
+    """Forgets the resolved profile builder of the resources using a profile that was replaced."""
+    for data in items.values():
+        if data.profile == profile:
+            data.profile_resolved = None
 
 
 class KResourceBuilder:
     """
     Kubernetes generic resource builder.
     """
+    __slots__ = ()
+
     def build(self, provider: Provider, resources: 'KResourceDatabase', name: str,
               config: Optional[Any], merge_config: Optional[Any]) -> ObjectItem:
         """
@@ -31,13 +95,15 @@ class KRStorageClass(KResourceBuilder):
     """
     A Kubernetes StorageClass builder.
     """
-    pass
+    __slots__ = ()
 
 
 class KRPersistentVolumeProfile(KResourceBuilder):
     """
     A Kubernetes PersistentVolume builder.
     """
+    __slots__ = ('storageclass',)
+
     storageclass: Optional[str]
 
     def __init__(self, storageclass: Optional[str] = None):
@@ -48,6 +114,8 @@ class KRPersistentVolumeClaimProfile(KResourceBuilder):
     """
     A Kubernetes PersistentVolumeClaims builder.
     """
+    __slots__ = ('storageclass',)
+
     storageclass: Optional[str]
 
     def __init__(self, storageclass: Optional[str] = None):
@@ -58,18 +126,19 @@ class KResourceDatabase:
     """
     A Kubernetes resource database.
     """
-    _persistentvolumeprofiles: Dict[str, KRPersistentVolumeProfile]
-    _persistentvolumeclaimprofiles: Dict[str, KRPersistentVolumeClaimProfile]
-    _storageclasses: Dict[str, Any]
-    _persistentvolumes: Dict[str, Any]
-    _persistentvolumeclaims: Dict[str, Any]
-
-    def __init__(self):
-        self._persistentvolumeprofiles = {}
-        self._persistentvolumeclaimprofiles = {}
-        self._storageclasses = {}
-        self._persistentvolumes = {}
-        self._persistentvolumeclaims = {}
+    # the dicts are only created on the first add, until then the empty class defaults are read
+    _persistentvolumeprofiles: Mapping[str, KRPersistentVolumeProfile] = MappingProxyType({})
+    _persistentvolumeclaimprofiles: Mapping[str, KRPersistentVolumeClaimProfile] = MappingProxyType({})
+    _storageclasses: Mapping[str, _StorageClassEntry] = MappingProxyType({})
+    _persistentvolumes: Mapping[str, _ProfileEntry] = MappingProxyType({})
+    _persistentvolumeclaims: Mapping[str, _ProfileEntry] = MappingProxyType({})
+
+    def _store(self, attr: str) -> Dict[str, Any]:
+        """Returns the instance dict of an attribute, creating it if needed."""
+        ret = self.__dict__.get(attr)
+        if ret is None:
+            ret = self.__dict__[attr] = {}
+        return ret
 
     def persistentvolumeprofile_add(self, name: str, profile: KRPersistentVolumeProfile) -> None:
         """
@@ -79,7 +148,8 @@ class KResourceDatabase:
         :param profile: profile builder
         :return: None
         """
-        self._persistentvolumeprofiles[name] = profile
+        self._store('_persistentvolumeprofiles')[name] = profile
+        _profile_resolved_reset(self._persistentvolumes, name)
 
     def persistentvolumeclaimprofile_add(self, name: str, profile: KRPersistentVolumeClaimProfile):
         """
@@ -89,7 +159,8 @@ class KResourceDatabase:
         :param profile: profile builder
         :return: None
         """
-        self._persistentvolumeclaimprofiles[name] = profile
+        self._store('_persistentvolumeclaimprofiles')[name] = profile
+        _profile_resolved_reset(self._persistentvolumeclaims, name)
 
     def persistentvolume_add(self, name: str, profile: str, config: Optional[Any] = None,
                              merge_config: Optional[Any] = None):
@@ -102,11 +173,7 @@ class KResourceDatabase:
         :param merge_config: a :class:`Mapping` to merge to the final object.
         :return: None
         """
-        self._persistentvolumes[name] = {
-            'profile': profile,
-            'config': config,
-            'merge_config': merge_config,
-        }
+        self._store('_persistentvolumes')[name] = _ProfileEntry(profile, config, merge_config)
 
     def persistentvolumeclaim_add(self, name: str, profile: str,
                                   config: Optional[Any] = None, merge_config: Optional[Any] = None):
@@ -119,11 +186,7 @@ class KResourceDatabase:
         :param merge_config: a :class:`Mapping` to merge to the final object.
         :return: None
         """
-        self._persistentvolumeclaims[name] = {
-            'profile': profile,
-            'config': config,
-            'merge_config': merge_config,
-        }
+        self._store('_persistentvolumeclaims')[name] = _ProfileEntry(profile, config, merge_config)
 
     def persistentvolume_build(self, provider: Provider, *persistentvolumenames: str) -> Sequence[ObjectItem]:
         """
@@ -133,11 +196,8 @@ class KResourceDatabase:
         :param persistentvolumenames: list of persistent volume names
         :return: list of :class:`kubragen.object.ObjectItem`
         """
-        ret = []
-        for pvname, pvdata in self._persistentvolumes.items():
-            if len(persistentvolumenames) == 0 or pvname in persistentvolumenames:
-                ret.append(self._persistentvolumeprofiles[pvdata['profile']].build(provider, self, pvname, pvdata['config'], pvdata['merge_config']))
-        return ret
+        return self._profile_build(provider, self._persistentvolumes, self._persistentvolumeprofiles,
+                                   persistentvolumenames)
 
     def persistentvolumeclaim_build(self, provider: Provider, *persistentvolumeclaimnames: str) -> Sequence[ObjectItem]:
         """
@@ -147,11 +207,14 @@ class KResourceDatabase:
         :param persistentvolumeclaimnames: list of persistent volume claim names
         :return: list of :class:`kubragen.object.ObjectItem`
         """
-        ret = []
-        for pvcname, pvcdata in self._persistentvolumeclaims.items():
-            if len(persistentvolumeclaimnames) == 0 or pvcname in persistentvolumeclaimnames:
-                ret.append(self._persistentvolumeclaimprofiles[pvcdata['profile']].build(provider, self, pvcname, pvcdata['config'], pvcdata['merge_config']))
-        return ret
+        return self._profile_build(provider, self._persistentvolumeclaims, self._persistentvolumeclaimprofiles,
+                                   persistentvolumeclaimnames)
+
+    def _profile_build(self, provider: Provider, items: Mapping[str, _ProfileEntry],
+                       profiles: Mapping[str, KResourceBuilder], names: Sequence[str]) -> Sequence[ObjectItem]:
+        return [(data.profile_resolved or _profile_resolve(profiles, data)).build(
+                    provider, self, name, data.config, data.merge_config)
+                for name, data in _filter_names(items, names)]
 
     def storageclass_add(self, name, storageclass: KRStorageClass, config: Optional[Any] = None,
                              merge_config: Optional[Any] = None):
@@ -164,11 +227,7 @@ class KResourceDatabase:
         :param merge_config: a :class:`Mapping` to merge to the final object.
         :return: None
         """
-        self._storageclasses[name] = {
-            'storageclass': storageclass,
-            'config': config,
-            'merge_config': merge_config,
-        }
+        self._store('_storageclasses')[name] = _StorageClassEntry(storageclass, config, merge_config)
 
     def storageclass_build(self, provider: Provider, *storageclassesnames: str) -> Sequence[ObjectItem]:
         """
@@ -178,17 +237,16 @@ class KResourceDatabase:
         :param storageclassesnames: list of storage class names.
         :return: list of :class:`kubragen.object.ObjectItem`
         """
-        ret = []
-        for scname, scvalue in self._storageclasses.items():
-            if len(storageclassesnames) == 0 or scname in storageclassesnames:
-                ret.append(scvalue['storageclass'].build(provider, self, scname, scvalue['config'], scvalue['merge_config']))
-        return copy.deepcopy(ret)
+        return [_clone(scvalue.storageclass.build(provider, self, scname, scvalue.config, scvalue.merge_config))
+                for scname, scvalue in _filter_names(self._storageclasses, storageclassesnames)]
 
 
 class KRStorageClass_Default(KRStorageClass):
     """
     Default storage class. Used to configure manually.
     """
+    __slots__ = ()
+
     def build(self, provider: Provider, resources: 'KResourceDatabase', name: str,
               config: Optional[Any], merge_config: Optional[Any]) -> ObjectItem:
         if config is not None:
@@ -210,6 +268,8 @@ class KRPersistentVolumeProfile_Default(KRPersistentVolumeProfile):
     """
     Default persistent volume profile. Used to configure manually.
     """
+    __slots__ = ()
+
     def build(self, provider: Provider, resources: 'KResourceDatabase', name: str,
               config: Optional[Any], merge_config: Optional[Any]) -> ObjectItem:
         pvdata: Dict[Any, Any] = {
@@ -234,6 +294,8 @@ class KRPersistentVolumeProfile_EmptyDir(KRPersistentVolumeProfile):
     """
     EmptyDir persistent volume profile.
     """
+    __slots__ = ()
+
     def build(self, provider: Provider, resources: 'KResourceDatabase', name: str,
               config: Optional[Any], merge_config: Optional[Any]) -> ObjectItem:
         pvdata: Dict[Any, Any] = {
@@ -259,6 +321,8 @@ class KRPersistentVolumeProfile_HostPath(KRPersistentVolumeProfile):
     """
     HostPath persistent volume profile.
     """
+    __slots__ = ()
+
     def build(self, provider: Provider, resources: 'KResourceDatabase', name: str,
               config: Optional[Any], merge_config: Optional[Any]) -> ObjectItem:
         pvdata: Dict[Any, Any] = {
@@ -292,6 +356,8 @@ class KRPersistentVolumeProfile_NFS(KRPersistentVolumeProfile):
     """
     NFS persistent volume profile.
     """
+    __slots__ = ()
+
     def build(self, provider: Provider, resources: 'KResourceDatabase', name: str,
               config: Optional[Any], merge_config: Optional[Any]) -> ObjectItem:
         pvdata: Dict[Any, Any] = {
@@ -324,6 +390,8 @@ class KRPersistentVolumeProfile_CSI(KRPersistentVolumeProfile):
     """
     CSI persistent volume profile.
     """
+    __slots__ = ()
+
     def build(self, provider: Provider, resources: 'KResourceDatabase', name: str,
               config: Optional[Any], merge_config: Optional[Any]) -> ObjectItem:
         pvdata: Dict[Any, Any] = {
@@ -356,6 +424,8 @@ class KRPersistentVolumeClaimProfile_Default(KRPersistentVolumeClaimProfile):
     """
     Default persistent volume claim profile. Used to configure manually.
     """
+    __slots__ = ()
+
     def build(self, provider: Provider, resources: 'KResourceDatabase', name: str,
               config: Optional[Any], merge_config: Optional[Any]) -> ObjectItem:
         pvcdata: Dict[Any, Any] = {
@@ -384,6 +454,8 @@ class KRPersistentVolumeClaimProfile_Basic(KRPersistentVolumeClaimProfile):
     Basic persistent volume claim profile.
     Supports auto-configuration from a PersistentVolume.
     """
+    __slots__ = ('allow_selector',)
+
     allow_selector: bool
 
     def __init__(self, storageclass: Optional[str] = None, allow_selector: bool = True):
@@ -414,24 +486,27 @@ class KRPersistentVolumeClaimProfile_Basic(KRPersistentVolumeClaimProfile):
                 persistentVolume = resources.persistentvolume_build(provider, config['persistentVolume'])[0]
 
         if persistentVolume is not None:
-            if dict_has_name(persistentVolume, 'spec.storageClassName'):
-                pv_storageclassname = dict_get_value(persistentVolume, 'spec.storageClassName')
-                if pv_storageclassname is not None:
-                    pvcdata['spec']['storageClassName'] = pv_storageclassname
-
-            if not dict_has_name(pvcdata, 'spec.accessModes') and dict_has_name(persistentVolume, 'spec.accessModes'):
-                pvcdata['spec']['accessModes'] = persistentVolume['spec']['accessModes']
-
-            if not dict_has_name(pvcdata, 'spec.resources.requests.storage') and dict_has_name(persistentVolume, 'spec.capacity.storage'):
-                Merger.merge(pvcdata, {
-                    'spec': {
-                        'resources': {
-                            'requests': {
-                                'storage': dict_get_value(persistentVolume, 'spec.capacity.storage'),
+            pv_storageclassname = dict_try_get(persistentVolume, 'spec.storageClassName')
+            if pv_storageclassname is not None:
+                pvcdata['spec']['storageClassName'] = pv_storageclassname
+
+            if not dict_has_name(pvcdata, 'spec.accessModes'):
+                pv_accessmodes = dict_try_get(persistentVolume, 'spec.accessModes', _MISSING)
+                if pv_accessmodes is not _MISSING:
+                    pvcdata['spec']['accessModes'] = pv_accessmodes
+
+            if not dict_has_name(pvcdata, 'spec.resources.requests.storage'):
+                pv_storage = dict_try_get(persistentVolume, 'spec.capacity.storage', _MISSING)
+                if pv_storage is not _MISSING:
+                    Merger.merge(pvcdata, {
+                        'spec': {
+                            'resources': {
+                                'requests': {
+                                    'storage': pv_storage,
+                                }
                             }
                         }
-                    }
-                })
+                    })
 
         ret = Merger.merge(pvcdata, merge_config if merge_config is not None else {})
 
@@ -1,4 +1,4 @@
-from typing import Union, Optional, Any, Sequence
+from typing import Union, Optional, Any, Sequence, List
 
 from .kresource import KResourceDatabase
 from .object import ObjectItem
@@ -26,17 +26,30 @@ class KubraGen:
         self.options = options
         self._resources = KResourceDatabase()
 
-    def secret_data_encode(self, data: Union[bytes, str]) -> str:
+    def secret_data_encode(self, data: Union[bytes, str], assume_encoded: bool = False) -> str:
         """
         Encode bytes or str secret using the current provider.
         By default encoding is done using base64, using the utf-8 charset.
 
         :param data: Data to encode
+        :param assume_encoded: if True, str data that is already valid base64 is returned unchanged
         :return: encoded secret
         :raises: :class:`kubragen.exception.KGException`
         """
+        if assume_encoded:
+            return self.provider.secret_data_encode(data, assume_encoded=True)
         return self.provider.secret_data_encode(data)
 
+    def secret_data_encode_many(self, datas: Sequence[Union[bytes, str]]) -> List[str]:
+        """
+        Encode a list of bytes or str secrets using the current provider.
+
+        :param datas: list of data to encode
+        :return: list of encoded secrets
+        :raises: :class:`kubragen.exception.KGException`
+        """
+        return self.provider.secret_data_encode_many(datas)
+
     def secret_data_encode_bytes(self, data: bytes) -> bytes:
         """
         Encode bytes secret using the current provider.
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, Optional, Sequence, Callable
+from typing import Any, Optional, Sequence, Callable, Tuple
 
 
 class Option:
@@ -55,7 +55,8 @@ class OptionDef(Option):
     default_value: Optional[Any]
     flags: Sequence[OptionDefFlags]
     format: OptionDefFormat
-    allowed_types: Optional[Sequence[Any]]
+    _allowed_types: Optional[Sequence[Any]]
+    _allowed_types_check: Optional[Tuple[Any, ...]]
 
     def __init__(self, required: bool = False, default_value: Optional[Any] = None,
                  flags: Optional[Sequence[OptionDefFlags]] = None, format: OptionDefFormat = OptionDefFormat.ANY,
@@ -74,6 +75,37 @@ class OptionDef(Option):
         """
         return flag in self.flags
 
+    @property
+    def allowed_types(self) -> Optional[Sequence[Any]]:
+        """
+        The list of allowed types. When set, it is converted to the form used by :func:`is_allowed_value`,
+        so changing the list in-place afterwards has no effect.
+        """
+        return self._allowed_types
+
+    @allowed_types.setter
+    def allowed_types(self, allowed_types: Optional[Sequence[Any]]) -> None:
+        self._allowed_types = allowed_types
+        if allowed_types is None:
+            self._allowed_types_check = None
+        else:
+            # None is handled by *required*
+            self._allowed_types_check = tuple(t for t in allowed_types if t is not None)
+
+    def is_allowed_value(self, value: Any) -> bool:
+        """
+        Checks whether the value is allowed by *required* and *allowed_types*.
+        Same as :func:`kubragen.util.is_allowed_types`.
+
+        :param value: the value to check
+        :return: whether the value is allowed
+        """
+        if value is None:
+            return not self.required
+        if self._allowed_types_check is None:
+            return True
+        return isinstance(value, self._allowed_types_check)
+
 
 class OptionRoot(Option):
     """
@@ -4,7 +4,11 @@ from .data import Data, DataClean
 from .exception import OptionError
 from .option import Option, OptionRoot, OptionDef, OptionValue
 from .private.options import OptionsCheckDefinitions
-from .util import dict_get_value, dict_has_name, is_allowed_types, type_name
+from .util import dict_get_value, dict_try_get, type_name
+
+_MISSING = object()
+
+_SCALAR_TYPES = (str, int, float, bool)
 
 
 class OptionsBase:
@@ -35,8 +39,10 @@ class OptionsBase:
         definition = dict_get_value(self.defined_options, name)
         if not isinstance(definition, Option):
             raise OptionError('Invalid option definition type: "{}"'.format(repr(definition)))
-        if self.options is not None and dict_has_name(self.options, name):
-            return definition, dict_get_value(self.options, name)
+        if self.options is not None:
+            value = dict_try_get(self.options, name, _MISSING)
+            if value is not _MISSING:
+                return definition, value
         return definition, definition
 
     def value_get(self, name: str) -> Any:
@@ -90,21 +96,29 @@ def option_root_get(options: OptionsBase, name: str, root_options: Optional[Opti
     :raises: :class:`kubragen.exception.OptionError`
     :raises: :class:`kubragen.exception.TypeError`
     """
-    definition, value = options.value_definition_get(name)
-    if isinstance(value, OptionRoot):
-        if root_options is None:
-            raise TypeError('Cannot get option from root')
-        value = root_options.value_get(value.name)
-
-    if isinstance(value, OptionDef):
-        value = value.default_value
-
-    if isinstance(value, OptionValue):
-        value = value.get_value(name, definition)
-
-    if not isinstance(value, Data):
+    definition: Optional[Option]
+    if options.defined_options is None:
+        # without definitions there is nothing to check the value against
+        definition = None
+        value = options.value_get(name)
+    else:
+        definition, value = options.value_definition_get(name)
+
+    if isinstance(value, Option):
+        if isinstance(value, OptionRoot):
+            if root_options is None:
+                raise TypeError('Cannot get option from root')
+            value = root_options.value_get(value.name)
+
+        if isinstance(value, OptionDef):
+            value = value.default_value
+
+        if isinstance(value, OptionValue):
+            value = value.get_value(name, definition)
+
+    if definition is not None and not isinstance(value, Data):
         if isinstance(definition, OptionDef):
-            if not is_allowed_types(value, definition.allowed_types, required=definition.required):
+            if not definition.is_allowed_value(value):
                 if definition.allowed_types is None or (value is None and definition.required):
                     raise TypeError('Option "{}" is required'.format(name))
 
@@ -118,6 +132,9 @@ def option_root_get(options: OptionsBase, name: str, root_options: Optional[Opti
                 ))
 
     if handle_data:
+        if value is None or type(value) in _SCALAR_TYPES:
+            # nothing to clean or copy
+            return value
         return DataClean(value, in_place=False)
     return value
 
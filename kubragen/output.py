@@ -1,14 +1,13 @@
+import functools
 import os
 import stat
 import string
-import uuid
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 
 import yaml
 
 from .exception import KGException
 from .kubragen import KubraGen
-from .object import Object
 from .yaml import YamlGenerator, YamlDumperBase
 
 
@@ -27,6 +26,14 @@ class OD_FileTemplate(OutputData):
     pass
 
 
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+
+@functools.lru_cache(maxsize=256)
+def _file_template(template: str) -> string.Template:
+    return string.Template(template)
+
+
 class OutputDataDumper:
     """Base class to data dumper to string."""
     kg: KubraGen
@@ -35,7 +42,12 @@ class OutputDataDumper:
         self.kg = kg
 
     def dump(self, data) -> str:
-        if isinstance(data, str):
+        t = type(data)
+        if t is str:
+            return data
+        elif t is bytes:
+            return data.decode('utf-8')
+        elif isinstance(data, str):
             return data
         elif isinstance(data, bytes):
             return data.decode('utf-8')
@@ -52,8 +64,10 @@ class OutputDataDumperDefault(OutputDataDumper):
         self.shfiles = shfiles
 
     def dump(self, data) -> str:
+        if type(data) is str:
+            return data
         if isinstance(data, OD_FileTemplate):
-            return string.Template(data).substitute(self.shfiles)
+            return _file_template(data).substitute(self.shfiles)
         return super().dump(data)
 
 
@@ -72,7 +86,7 @@ class OutputFile:
     def __init__(self, filename: str, is_sequence: bool = True):
         self.filename = filename
         self.is_sequence = is_sequence
-        self.fileid = str(uuid.uuid4()).replace('-', '')
+        self.fileid = os.urandom(16).hex()
         self.data = []
 
     def append(self, data: Any) -> None:
@@ -93,7 +107,7 @@ class OutputFile:
         if self.is_sequence:
             if seq is None:
                 raise KGException('Sequence is required for sequence files')
-            return '{:03d}-{}'.format(seq+1, self.filename)
+            return f'{seq + 1:03d}-{self.filename}'
         else:
             return self.filename
 
@@ -115,12 +129,8 @@ class OutputFile:
 
         :param dumper: dumper to use to output
         """
-        ret = []
-        for d in self.data:
-            if d is None:
-                continue
-            ret.append(dumper.dump(d))
-        return '\n'.join(ret)
+        dump = dumper.dump
+        return '\n'.join([dump(d) for d in self.data if d is not None])
 
 
 class OutputDriver:
@@ -171,19 +181,13 @@ class OutputProject:
 
         :param driver: driver to output to
         """
-        shfiles = {}
-        for fidx, f in enumerate(self.out_sequence):
-            shfiles['FILE_{}'.format(f.fileid)] = f.output_filename(fidx)
-        for fidx, f in enumerate(self.out_single):
-            shfiles['FILE_{}'.format(f.fileid)] = f.output_filename()
-
-        odd = OutputDataDumperDefault(self.kg, shfiles)
+        files: List[Tuple[OutputFile, str]] = [(f, f.output_filename(fidx)) for fidx, f in enumerate(self.out_sequence)]
+        files.extend([(f, f.output_filename()) for f in self.out_single])
 
-        for fidx, f in enumerate(self.out_sequence):
-            driver.write_file(f, f.output_filename(fidx), f.to_string(odd))
+        odd = OutputDataDumperDefault(self.kg, {'FILE_' + f.fileid: filename for f, filename in files})
 
-        for fidx, f in enumerate(self.out_single):
-            driver.write_file(f, f.output_filename(), f.to_string(odd))
+        for f, filename in files:
+            driver.write_file(f, filename, f.to_string(odd))
 
 
 #
@@ -205,13 +209,12 @@ class OutputFile_ShellScript(OutputFile):
         return True
 
     def to_string(self, dumper: OutputDataDumper) -> str:
-        ret = [
-            '#!/bin/bash',
-            '',
-            super().to_string(dumper),
-            ''
-        ]
-        return '\n'.join(ret)
+        return '#!/bin/bash\n\n{}\n'.format(super().to_string(dumper))
+
+
+def _output_data(data: List[Any]) -> List[Any]:
+    """Returns the items of data that generate output. None and empty lists are skipped, including their separator."""
+    return [d for d in data if d is not None and not (isinstance(d, list) and len(d) == 0)]
 
 
 class OutputFile_Yaml(OutputFile):
@@ -223,23 +226,22 @@ class OutputFile_Yaml(OutputFile):
         if self.data is None:
             return ''
         yaml_dump_params: Dict[Any, Any] = {'default_flow_style': False, 'sort_keys': False}
-        ret = []
-        is_first: bool = True
-        for d in self.data:
-            if d is None:
-                continue
-            if not is_first:
-                ret.append('---')
-            if isinstance(d, list) and len(d) == 0:
-                continue
-            is_first = False
-            if isinstance(d, dict) or isinstance(d, list) or isinstance(d, Object):
-                if isinstance(d, list):
-                    ret.append(yaml.dump_all(d, Dumper=YamlDumperBase, **yaml_dump_params))
-                else:
-                    ret.append(yaml.dump(d, Dumper=YamlDumperBase, **yaml_dump_params))
+        yaml_dump = yaml.dump
+        yaml_dump_all = yaml.dump_all
+        dump = dumper.dump
+        ret: List[str] = []
+        append = ret.append
+        for idx, d in enumerate(_output_data(self.data)):
+            if idx > 0:
+                append('---')
+            # exact type checks first, isinstance only for subclasses (Object is a dict)
+            t = type(d)
+            if t is list or (t is not dict and isinstance(d, list)):
+                append(yaml_dump_all(d, Dumper=YamlDumperBase, **yaml_dump_params))
+            elif t is dict or isinstance(d, dict):
+                append(yaml_dump(d, Dumper=YamlDumperBase, **yaml_dump_params))
             else:
-                ret.append(dumper.dump(d))
+                append(dump(d))
         return '\n'.join(ret)
 
 
@@ -251,24 +253,25 @@ class OutputFile_Kubernetes(OutputFile):
     def to_string(self, dumper: OutputDataDumper) -> str:
         if self.data is None:
             return ''
-        yd = YamlGenerator(dumper.kg)
-        ret = []
+        generate = YamlGenerator(dumper.kg).generate
+        dump = dumper.dump
+        ret: List[str] = []
+        append = ret.append
         is_first: bool = True
-        for d in self.data:
-            if d is None:
-                continue
-            if isinstance(d, OD_Raw):
-                ret.append(dumper.dump(d))
+        for d in _output_data(self.data):
+            # exact type checks first, isinstance only for subclasses (Object is a dict)
+            t = type(d)
+            is_yaml = t is dict or t is list or isinstance(d, (dict, list))
+            if not is_yaml and isinstance(d, OD_Raw):
+                append(dump(d))
                 continue
             if not is_first:
-                ret.append('---')
-            if isinstance(d, list) and len(d) == 0:
-                continue
+                append('---')
             is_first = False
-            if isinstance(d, dict) or isinstance(d, list) or isinstance(d, Object):
-                ret.append(yd.generate(d))
+            if is_yaml:
+                append(generate(d))
             else:
-                ret.append(dumper.dump(d))
+                append(dump(d))
         return '\n'.join(ret)
 
 
@@ -292,13 +295,16 @@ class OutputDriver_Directory(OutputDriver):
 
     def __init__(self, path):
         self.path = path
-        if not os.path.exists(path):
-            os.makedirs(path)
+        os.makedirs(path, exist_ok=True)
 
     def write_file(self, file: OutputFile, filename, filecontents) -> None:
         outfilename = os.path.join(self.path, filename)
-        with open(outfilename, 'w', newline=file.file_newline(), encoding=file.file_encoding()) as fl:
+        mode: Optional[int] = None
+        with open(outfilename, 'w', buffering=_WRITE_BUFFER_SIZE, newline=file.file_newline(),
+                  encoding=file.file_encoding()) as fl:
             fl.write(filecontents)
-        if file.file_executable():
-            st = os.stat(outfilename)
-            os.chmod(outfilename, st.st_mode | stat.S_IEXEC)
+            if file.file_executable():
+                # stat the open file instead of resolving the path again
+                mode = os.fstat(fl.fileno()).st_mode
+        if mode is not None:
+            os.chmod(outfilename, mode | stat.S_IEXEC)
@@ -1,5 +1,8 @@
+import functools
+
 import deepmerge  # type: ignore
 import jsonpatchext  # type: ignore
+from jsonpatch import JsonPointer  # type: ignore
 
 from ..data import Data
 from ..helper import HelperStr, HelperStrNewInstance
@@ -7,6 +10,10 @@ from ..helper import HelperStr, HelperStrNewInstance
 
 class JSONPatchMerger(deepmerge.Merger):
     def value_strategy(self, path, base, nxt):
+        tbase = type(base)
+        if tbase is dict or tbase is list or tbase is str:
+            # plain values are never Data or HelperStr
+            return super().value_strategy(path, base, nxt)
         if isinstance(base, Data):
             # If merging with Data class, merge with its value
             newbase = None
@@ -18,7 +25,7 @@ class JSONPatchMerger(deepmerge.Merger):
                 elif isinstance(base.get_value(), list):
                     newbase = []
             return super().value_strategy(path, newbase, nxt)
-        elif isinstance(base, HelperStr) and isinstance(nxt, HelperStr):
+        elif isinstance(base, HelperStr) and type(nxt) is not str and isinstance(nxt, HelperStr):
             # if both are HelperStr, use the type of nxt
             return super().value_strategy(path, str(base), nxt)
         return super().value_strategy(path, base, nxt)
@@ -26,7 +33,7 @@ class JSONPatchMerger(deepmerge.Merger):
 
 def jsonpatch_merge_fallback(config, path, base, nxt):
     if isinstance(base, str) and isinstance(nxt, str):
-        if isinstance(base, HelperStr) and not isinstance(nxt, HelperStr):
+        if type(base) is not str and isinstance(base, HelperStr) and not isinstance(nxt, HelperStr):
             # Use the same HelperStr class of the base
             return HelperStrNewInstance(base, nxt)
         else:
@@ -53,6 +60,12 @@ class KGMergeOperation(jsonpatchext.MergeOperation):
             jsonpatch_merge.merge(subobj, value)
 
 
+@functools.lru_cache(maxsize=512)
+def _json_pointer(path: str) -> JsonPointer:
+    # patches are applied only, which never changes the pointer, so they can be shared
+    return JsonPointer(path)
+
+
 class KGJsonPatchExt(jsonpatchext.JsonPatchExt):
     def __init__(self, patch):
         # Must inherit jsonpatchext.JsonPatchExt to change the merge operation class
@@ -60,3 +73,17 @@ class KGJsonPatchExt(jsonpatchext.JsonPatchExt):
         self.operations.update({
             'merge': KGMergeOperation,
         })
+        self._ops_cached = None
+
+    @property
+    def _ops(self):
+        # the base class builds the operations again on each access
+        if self._ops_cached is None:
+            self._ops_cached = super()._ops
+        return self._ops_cached
+
+    def _get_operation(self, operation):
+        if type(operation) is dict and type(operation.get('path')) is str:
+            # don't parse the same paths again for each patch
+            operation = dict(operation, path=_json_pointer(operation['path']))
+        return super()._get_operation(operation)
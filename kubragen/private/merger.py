@@ -11,21 +11,21 @@ def option_check_key_exist(config, path, base, nxt):
     return deepmerge.STRATEGY_END
 
 
+class _MergeValuesError(MergeError):
+    """A :class:`kubragen.exception.MergeError` that only formats its message when it is displayed."""
+    def __init__(self, title, path, base, nxt):
+        super().__init__(title, list(path), base, nxt)
+
+    def __str__(self):
+        title, path, base, nxt = self.args
+        if len(path) > 0:
+            return "{} at '{}': {}, {}".format(title, '.'.join(path), repr(base), repr(nxt))
+        return "{}: {}, {}".format(title, repr(base), repr(nxt))
+
+
 def option_type_conflict(config, path, base, nxt):
-    if len(path) > 0:
-        raise MergeError("Type conflict at '{}': {}, {}".format(
-            '.'.join(path), repr(base), repr(nxt)
-        ))
-    raise MergeError("Type conflict: {}, {}".format(
-        repr(base), repr(nxt)
-    ))
+    raise _MergeValuesError('Type conflict', path, base, nxt)
 
 
 def option_merge_fallback(config, path, base, nxt):
-    if len(path) > 0:
-        raise MergeError("Merge fallback at '{}': {}, {}".format(
-            '.'.join(path), repr(base), repr(nxt)
-        ))
-    raise MergeError("Merge fallback: {}, {}".format(
-        repr(base), repr(nxt)
-    ))
+    raise _MergeValuesError('Merge fallback', path, base, nxt)
@@ -6,16 +6,29 @@ from ..option import Option
 
 def _options_checkdefinitions(path: Sequence[str], defined_options: Optional[Mapping[Any, Any]],
                               options: Optional[Mapping[Any, Any]]) -> None:
-    if defined_options is None or options is None:
+    if defined_options is None or not options:
         return
 
-    for oname, ovalue in options.items():
-        if oname not in defined_options:
-            raise OptionError('Unknown option: "{}.{}"'.format('.'.join(path), oname))
-        if isinstance(defined_options[oname], Option):
-            continue
-        if isinstance(ovalue, Mapping):
-            _options_checkdefinitions([*path, oname], defined_options[oname], ovalue)
+    # depth-first walk using a stack of item iterators, to report errors in the same order as a recursive walk.
+    # cur_path is shared by all levels, a name is pushed when entering a mapping and popped when leaving it.
+    cur_path = list(path)
+    stack = [(defined_options, iter(options.items()))]
+    while stack:
+        cur_defined, cur_items = stack[-1]
+        for oname, ovalue in cur_items:
+            if oname not in cur_defined:
+                raise OptionError('Unknown option: "{}.{}"'.format('.'.join(cur_path), oname))
+            odefined = cur_defined[oname]
+            if odefined is None or isinstance(odefined, Option):
+                continue
+            if isinstance(ovalue, Mapping) and ovalue:
+                cur_path.append(oname)
+                stack.append((odefined, iter(ovalue.items())))
+                break
+        else:
+            stack.pop()
+            if stack:
+                cur_path.pop()
 
 
 def OptionsCheckDefinitions(defined_options: Optional[Mapping[Any, Any]],
@@ -28,3 +41,4 @@ def OptionsCheckDefinitions(defined_options: Optional[Mapping[Any, Any]],
     :raises: :class:`kubragen.exception.OptionError`
     """
     _options_checkdefinitions([], defined_options, options)
+
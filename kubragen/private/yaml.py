@@ -3,7 +3,8 @@ from yaml.representer import SafeRepresenter
 
 def change_style(style, representer):
     def new_representer(dumper, data):
-        scalar = representer(dumper, data)
+        # the libyaml emitter only accepts exact str values, not HelperStr subclasses
+        scalar = representer(dumper, str(data))
         scalar.style = style
         return scalar
     return new_representer
@@ -1,14 +1,40 @@
-import base64
-from typing import Union, Sequence, Optional
+import binascii
+import functools
+import re
+from typing import Union, Sequence, Optional, List
 
 import semver  # type: ignore
 
+try:
+    # SIMD accelerated base64, if installed
+    import pybase64 as _base64  # type: ignore
+except ImportError:
+    import base64 as _base64  # type: ignore
+
 from .consts import PROVIDER_GENERIC, PROVIDERSVC_GENERIC, DEFAULT_KUBERNETES_VERSION
 from .exception import InvalidParamError
 from .object import ObjectItem
 from .types import TProvider, TProviderSvc
 
 
+_BASE64_RE = re.compile(r'[A-Za-z0-9+/]*={0,2}')
+
+# inputs up to this size are encoded directly with binascii, which has less call overhead
+_SECRET_SMALL_SIZE = 1024
+
+
+def _b64encode(data: bytes) -> bytes:
+    if len(data) <= _SECRET_SMALL_SIZE:
+        return binascii.b2a_base64(data, newline=False)
+    return _base64.b64encode(data)
+
+
+@functools.lru_cache(maxsize=64)
+def _kubernetes_version_parse(version: str) -> semver.VersionInfo:
+    # VersionInfo is immutable, so parsed versions can be shared
+    return semver.VersionInfo.parse(version)
+
+
 class Provider:
     """
     Represents a target Kubernetes service provider to allow builders to customize objects.
@@ -31,33 +57,50 @@ class Provider:
             self.kubernetes_version = kubernetes_version
         else:
             try:
-                self.kubernetes_version = semver.VersionInfo.parse(kubernetes_version)
+                self.kubernetes_version = _kubernetes_version_parse(kubernetes_version)
             except Exception as e:
                 raise InvalidParamError(str(e)) from e
 
-    def secret_data_encode(self, data: Union[bytes, str]) -> str:
+    def secret_data_encode(self, data: Union[bytes, str], assume_encoded: bool = False) -> str:
         """
         Encode bytes or str secret using the current provider.
         By default encoding is done using base64, using the utf-8 charset.
 
         :param data: Data to encode
+        :param assume_encoded: if True, str data that is already valid base64 is returned unchanged
         :return: encoded secret
         :raises: KGException
         """
+        if assume_encoded and isinstance(data, str) and len(data) % 4 == 0 and _BASE64_RE.fullmatch(data):
+            return data
         if isinstance(data, str):
             data = data.encode('utf-8')
-        return self.secret_data_encode_bytes(data).decode("utf-8")
+        # base64 output is always ascii
+        return self.secret_data_encode_bytes(data).decode('ascii')
+
+    def secret_data_encode_many(self, datas: Sequence[Union[bytes, str]]) -> List[str]:
+        """
+        Encode a list of bytes or str secrets using the current provider.
+        The result is the same as calling :meth:`secret_data_encode` for each item.
+
+        :param datas: list of data to encode
+        :return: list of encoded secrets
+        :raises: KGException
+        """
+        return [self.secret_data_encode(data) for data in datas]
 
     def secret_data_encode_bytes(self, data: bytes) -> bytes:
         """
         Encode bytes secret using the current provider.
-        By default encoding is done using base64, and raw bytes are returned
+        By default encoding is done using base64, and raw bytes are returned.
+        The returned bytes must be ascii, like base64, as :meth:`secret_data_encode` decodes them as ascii.
+        If the :mod:`pybase64` module is installed, it is used instead of :mod:`base64` for large data.
 
         :param data: Data to encode
         :return: encoded secret
         :raises: KGException
         """
-        return base64.b64encode(data)
+        return _b64encode(data)
 
     def objects_check(self, objects: Sequence[ObjectItem]) -> Sequence[ObjectItem]:
         """
@@ -75,3 +118,22 @@ class Provider_Generic(Provider):
     """
     def __init__(self, kubernetes_version: Optional[Union[str, semver.VersionInfo]] = None):
         super().__init__(provider=PROVIDER_GENERIC, service=PROVIDERSVC_GENERIC, kubernetes_version=kubernetes_version)
+
+
+@functools.lru_cache(maxsize=16)
+def _provider_generic_shared(kubernetes_version: str) -> Provider_Generic:
+    return Provider_Generic(kubernetes_version=kubernetes_version)
+
+
+def ProviderGenericShared(kubernetes_version: Optional[Union[str, semver.VersionInfo]] = None) -> Provider_Generic:
+    """
+    Returns a shared :class:`Provider_Generic` instance for the Kubernetes version, for code that creates
+    many :class:`kubragen.kubragen.KubraGen` instances with the generic provider.
+    The instance is shared between all callers, so it must not be modified.
+
+    :param kubernetes_version: Target Kubernetes version, to be parsed using the :mod:`semver` module
+    :return: the shared :class:`Provider_Generic` instance
+    """
+    if kubernetes_version is None:
+        kubernetes_version = DEFAULT_KUBERNETES_VERSION
+    return _provider_generic_shared(str(kubernetes_version))
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from kubragen.data import ValueData
@@ -235,3 +236,21 @@ class TestJSONPatch(unittest.TestCase):
 
         self.assertEqual(ret, [{'foo': 'bar', 'shin': 'bai'}])
         self.assertIsInstance(ret[0]['shin'], LiteralStr)
+
+    def test_pickle(self):
+        data = [
+            Object({
+                'foo': 'bar',
+                'shin': 'gami',
+            }, name='x', source='y', instance='z')
+        ]
+        jp = FilterJSONPatch(filters={'names': ['x']}, patches=[
+            {'op': 'replace', 'path': '/shin', 'value': 'bai'}
+        ])
+
+        data = pickle.loads(pickle.dumps(data))
+        jp = pickle.loads(pickle.dumps(jp))
+
+        self.assertEqual((data[0].name, data[0].source, data[0].instance), ('x', 'y', 'z'))
+        ret = FilterJSONPatches_Apply(items=data, jsonpatches=[jp])
+        self.assertEqual(ret, [{'foo': 'bar', 'shin': 'bai'}])
@@ -1,261 +1,160 @@
+import copy
 import unittest
 
 from kubragen.kdata import KData_ConfigMap, KData_ConfigMapManual, KData_Secret, KData_SecretManual
 from kubragen.kdatahelper import KDataHelper_Env, KDataHelper_Volume
 
 
-class TestKData(unittest.TestCase):
-    def test_helper_env_value(self):
-        kdata = KDataHelper_Env.info(base_value={
-            'name': 'APP_PASSWORD',
-        }, value='mypassword', default_value={
-            'valueFrom': {
-                'secretKeyRef': {
-                    'name': 'bt-config-secret',
-                    'key': 'password'
-                }
-            },
-        })
-        self.assertEqual(kdata, {
-            'name': 'APP_PASSWORD',
-            'value': 'mypassword',
-        })
-
-    def test_helper_env_none(self):
-        kdata = KDataHelper_Env.info(base_value={
-            'name': 'APP_PASSWORD',
-        }, value=None, default_value={
-            'valueFrom': {
-                'secretKeyRef': {
-                    'name': 'bt-config-secret',
-                    'key': 'password'
-                }
-            },
-        })
-        self.assertEqual(kdata, {
-            'name': 'APP_PASSWORD',
-            'valueFrom': {
-                'secretKeyRef': {
-                    'name': 'bt-config-secret',
-                    'key': 'password'
-                }
-            },
-        })
-
-    def test_helper_env_configmap(self):
-        kdata = KDataHelper_Env.info(base_value={
-            'name': 'APP_PASSWORD',
-        }, value=KData_ConfigMap(configmapName='mycm', configmapData='cmdata'), default_value={
-            'valueFrom': {
-                'secretKeyRef': {
-                    'name': 'bt-config-secret',
-                    'key': 'password'
-                }
-            },
-        })
-        self.assertEqual(kdata, {
-            'name': 'APP_PASSWORD',
-            'valueFrom': {
-                'configMapKeyRef': {
-                    'name': 'mycm',
-                    'key': 'cmdata'
-                }
-            },
-        })
-
-    def test_helper_env_kdata(self):
-        kdata = KDataHelper_Env.info(base_value={
-            'name': 'APP_PASSWORD',
-        }, value_if_kdata=KData_ConfigMap(configmapName='mycm', configmapData='cmdata'), default_value={
-            'valueFrom': {
-                'secretKeyRef': {
-                    'name': 'bt-config-secret',
-                    'key': 'password'
-                }
-            },
-        })
-        self.assertEqual(kdata, {
-            'name': 'APP_PASSWORD',
-            'valueFrom': {
-                'configMapKeyRef': {
-                    'name': 'mycm',
-                    'key': 'cmdata'
-                }
-            },
-        })
-
-    def test_helper_env_kdata_notkdata(self):
-        kdata = KDataHelper_Env.info(base_value={
-            'name': 'APP_PASSWORD',
-        }, value_if_kdata='not a KData', default_value={
-            'valueFrom': {
-                'secretKeyRef': {
-                    'name': 'bt-config-secret',
-                    'key': 'password'
-                }
-            },
-        })
-        self.assertEqual(kdata, {
-            'name': 'APP_PASSWORD',
-            'valueFrom': {
-                'secretKeyRef': {
-                    'name': 'bt-config-secret',
-                    'key': 'password'
-                }
-            },
-        })
-
-    def test_helper_volume_value(self):
-        kdata = KDataHelper_Volume.info(base_value={
-            'name': 'data-volume',
-        }, value={
-            'emptyDir': {},
-        }, default_value={
-            'persistentVolumeClaim': {
-                'claimName': 'bt-storage-claim'
-            }
-        })
-        self.assertEqual(kdata, {
-            'name': 'data-volume',
-            'emptyDir': {},
-        })
-
-    def test_helper_volume_none(self):
-        kdata = KDataHelper_Volume.info(base_value={
-            'name': 'data-volume',
-        }, value=None, default_value={
-            'persistentVolumeClaim': {
-                'claimName': 'bt-storage-claim'
-            }
-        })
-        self.assertEqual(kdata, {
-            'name': 'data-volume',
-            'persistentVolumeClaim': {
-                'claimName': 'bt-storage-claim'
-            }
-        })
-
-    def test_helper_volume_configmap(self):
-        kdata = KDataHelper_Volume.info(base_value={
-            'name': 'data-volume',
-        }, value=KData_ConfigMap(configmapName='mycm', configmapData='cmdata'), default_value={
-            'persistentVolumeClaim': {
-                'claimName': 'bt-storage-claim'
-            }
-        })
-        self.assertEqual(kdata, {
-            'name': 'data-volume',
-            'configMap': {
-                'name': 'mycm',
-                'items': [{
-                    'key': 'cmdata',
-                    'path': 'cmdata',
-                }],
-            }
-        })
-
-    def test_helper_volume_kdata(self):
-        kdata = KDataHelper_Volume.info(base_value={
-            'name': 'data-volume',
-        }, value_if_kdata=KData_ConfigMap(configmapName='mycm', configmapData='cmdata'), default_value={
-            'persistentVolumeClaim': {
-                'claimName': 'bt-storage-claim'
+ENV_BASE_VALUE = {
+    'name': 'APP_PASSWORD',
+}
+
+ENV_DEFAULT_VALUE = {
+    'valueFrom': {
+        'secretKeyRef': {
+            'name': 'bt-config-secret',
+            'key': 'password'
+        }
+    },
+}
+
+ENV_CONFIGMAP_VALUE = {
+    'name': 'APP_PASSWORD',
+    'valueFrom': {
+        'configMapKeyRef': {
+            'name': 'mycm',
+            'key': 'cmdata'
+        }
+    },
+}
+
+# name, info params, expected result
+ENV_CASES = [
+    ('value', {'value': 'mypassword'}, {
+        'name': 'APP_PASSWORD',
+        'value': 'mypassword',
+    }),
+    ('none', {'value': None}, {
+        'name': 'APP_PASSWORD',
+        'valueFrom': {
+            'secretKeyRef': {
+                'name': 'bt-config-secret',
+                'key': 'password'
             }
-        })
-        self.assertEqual(kdata, {
-            'name': 'data-volume',
-            'configMap': {
-                'name': 'mycm',
-                'items': [{
-                    'key': 'cmdata',
-                    'path': 'cmdata',
-                }],
+        },
+    }),
+    ('configmap', {'value': KData_ConfigMap(configmapName='mycm', configmapData='cmdata')}, ENV_CONFIGMAP_VALUE),
+    ('kdata', {'value_if_kdata': KData_ConfigMap(configmapName='mycm', configmapData='cmdata')},
+     ENV_CONFIGMAP_VALUE),
+    ('kdata_notkdata', {'value_if_kdata': 'not a KData'}, {
+        'name': 'APP_PASSWORD',
+        'valueFrom': {
+            'secretKeyRef': {
+                'name': 'bt-config-secret',
+                'key': 'password'
             }
-        })
-
-    def test_helper_volume_configmap_manual(self):
-        kdata = KDataHelper_Volume.info(base_value={
-            'name': 'data-volume',
-        }, value=KData_ConfigMapManual(configmapName='mycm', merge_config={
-            'configMap': {
-                'items': [{
-                    'key': 'xcmdata',
-                    'path': 'xcmdata',
-                }],
-            },
-        }), default_value={
-            'persistentVolumeClaim': {
-                'claimName': 'bt-storage-claim'
-            }
-        })
-
-        self.assertEqual(kdata, {
-            'name': 'data-volume',
-            'configMap': {
-                'name': 'mycm',
-                'items': [{
-                    'key': 'xcmdata',
-                    'path': 'xcmdata',
-                }],
-            }
-        })
-
-    def test_helper_volume_kdata_notkdata(self):
-        kdata = KDataHelper_Volume.info(base_value={
-            'name': 'data-volume',
-        }, value_if_kdata='not a KData', default_value={
-            'persistentVolumeClaim': {
-                'claimName': 'bt-storage-claim'
-            }
-        })
-        self.assertEqual(kdata, {
-            'name': 'data-volume',
-            'persistentVolumeClaim': {
-                'claimName': 'bt-storage-claim'
-            }
-        })
-
-    def test_helper_volume_secret(self):
-        kdata = KDataHelper_Volume.info(base_value={
-            'name': 'data-volume',
-        }, value=KData_Secret(secretName='mycm', secretData='cmdata'), default_value={
-            'persistentVolumeClaim': {
-                'claimName': 'bt-storage-claim'
-            }
-        })
-        self.assertEqual(kdata, {
-            'name': 'data-volume',
-            'secret': {
-                'secretName': 'mycm',
-                'items': [{
-                    'key': 'cmdata',
-                    'path': 'cmdata',
-                }],
-            }
-        })
-
-    def test_helper_volume_secret_manual(self):
-        kdata = KDataHelper_Volume.info(base_value={
-            'name': 'data-volume',
-        }, value=KData_SecretManual(secretName='mycm', merge_config={
-            'secret': {
-                'items': [{
-                    'key': 'xcmdata',
-                    'path': 'xcmdata',
-                }],
-            },
-        }), default_value={
-            'persistentVolumeClaim': {
-                'claimName': 'bt-storage-claim'
-            }
-        })
-        self.assertEqual(kdata, {
-            'name': 'data-volume',
-            'secret': {
-                'secretName': 'mycm',
-                'items': [{
-                    'key': 'xcmdata',
-                    'path': 'xcmdata',
-                }],
-            }
-        })
\ No newline at end of file
+        },
+    }),
+]
+
+VOLUME_BASE_VALUE = {
+    'name': 'data-volume',
+}
+
+VOLUME_DEFAULT_VALUE = {
+    'persistentVolumeClaim': {
+        'claimName': 'bt-storage-claim'
+    }
+}
+
+VOLUME_CONFIGMAP_VALUE = {
+    'name': 'data-volume',
+    'configMap': {
+        'name': 'mycm',
+        'items': [{
+            'key': 'cmdata',
+            'path': 'cmdata',
+        }],
+    }
+}
+
+VOLUME_DEFAULT_RESULT = {
+    'name': 'data-volume',
+    'persistentVolumeClaim': {
+        'claimName': 'bt-storage-claim'
+    }
+}
+
+# name, info params, expected result
+VOLUME_CASES = [
+    ('value', {'value': {'emptyDir': {}}}, {
+        'name': 'data-volume',
+        'emptyDir': {},
+    }),
+    ('none', {'value': None}, VOLUME_DEFAULT_RESULT),
+    ('configmap', {'value': KData_ConfigMap(configmapName='mycm', configmapData='cmdata')}, VOLUME_CONFIGMAP_VALUE),
+    ('kdata', {'value_if_kdata': KData_ConfigMap(configmapName='mycm', configmapData='cmdata')},
+     VOLUME_CONFIGMAP_VALUE),
+    ('configmap_manual', {'value': KData_ConfigMapManual(configmapName='mycm', merge_config={
+        'configMap': {
+            'items': [{
+                'key': 'xcmdata',
+                'path': 'xcmdata',
+            }],
+        },
+    })}, {
+        'name': 'data-volume',
+        'configMap': {
+            'name': 'mycm',
+            'items': [{
+                'key': 'xcmdata',
+                'path': 'xcmdata',
+            }],
+        }
+    }),
+    ('kdata_notkdata', {'value_if_kdata': 'not a KData'}, VOLUME_DEFAULT_RESULT),
+    ('secret', {'value': KData_Secret(secretName='mycm', secretData='cmdata')}, {
+        'name': 'data-volume',
+        'secret': {
+            'secretName': 'mycm',
+            'items': [{
+                'key': 'cmdata',
+                'path': 'cmdata',
+            }],
+        }
+    }),
+    ('secret_manual', {'value': KData_SecretManual(secretName='mycm', merge_config={
+        'secret': {
+            'items': [{
+                'key': 'xcmdata',
+                'path': 'xcmdata',
+            }],
+        },
+    })}, {
+        'name': 'data-volume',
+        'secret': {
+            'secretName': 'mycm',
+            'items': [{
+                'key': 'xcmdata',
+                'path': 'xcmdata',
+            }],
+        }
+    }),
+]
+
+
+# info() changes base_value, so each case uses a copy of the base values
+class TestKData(unittest.TestCase):
+    def test_helper_env(self):
+        for name, params, expected in ENV_CASES:
+            with self.subTest(name):
+                kdata = KDataHelper_Env.info(base_value=copy.deepcopy(ENV_BASE_VALUE),
+                                             default_value=copy.deepcopy(ENV_DEFAULT_VALUE), **params)
+                self.assertEqual(kdata, expected)
+
+    def test_helper_volume(self):
+        for name, params, expected in VOLUME_CASES:
+            with self.subTest(name):
+                kdata = KDataHelper_Volume.info(base_value=copy.deepcopy(VOLUME_BASE_VALUE),
+                                                default_value=copy.deepcopy(VOLUME_DEFAULT_VALUE), **params)
+                self.assertEqual(kdata, expected)
@@ -0,0 +1,41 @@
+import unittest
+
+from kubragen.helper import QuotedStr
+from kubragen.kresource import KResourceDatabase, KRStorageClass
+from kubragen.provider import Provider_Generic
+
+
+class StorageClassShared(KRStorageClass):
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    def build(self, provider, resources, name, config, merge_config):
+        return self.data
+
+
+class TestKResource(unittest.TestCase):
+    def test_storageclass_build_copy(self):
+        data = {
+            'apiVersion': 'storage.k8s.io/v1',
+            'kind': 'StorageClass',
+            'metadata': {
+                'name': 'storage',
+            },
+            'parameters': {
+                'type': QuotedStr('pd-ssd'),
+            },
+            'mountOptions': ['debug'],
+        }
+        resources = KResourceDatabase()
+        resources.storageclass_add('storage', StorageClassShared(data))
+
+        sc1 = resources.storageclass_build(Provider_Generic(), 'storage')[0]
+        sc2 = resources.storageclass_build(Provider_Generic(), 'storage')[0]
+        sc1['metadata']['name'] = 'changed'
+        sc1['mountOptions'].append('changed')
+
+        self.assertEqual(sc2, data)
+        self.assertEqual(data['metadata']['name'], 'storage')
+        self.assertIsInstance(sc2['parameters']['type'], QuotedStr)
@@ -8,6 +8,20 @@ from kubragen.option import OptionDef, OptionRoot, OptionDefaultValue, OptionVal
 from kubragen.options import Options, option_root_get, OptionsBase
 
 
+class TOptionValue(OptionValue):
+    def get_value(self, name: Optional[str] = None, base_option: Optional[Option] = None) -> Any:
+        return 'baz_value'
+
+
+class TOptions(Options):
+    def define_options(self):
+        return {
+            'foo': {
+                'bar': OptionDef(default_value='baz'),
+            }
+        }
+
+
 class TestOptions(unittest.TestCase):
 
     def test_options_standalone(self):
@@ -18,6 +32,20 @@ class TestOptions(unittest.TestCase):
         })
         self.assertEqual(options.value_get('foo.bar'), 'baz')
 
+    def test_options_standalone_root_get(self):
+        root_options = Options({
+            'root_bar': 'baz_root',
+        })
+
+        options = Options({
+            'foo': {
+                'bar': 'baz',
+                'root': OptionRoot('root_bar'),
+            }
+        })
+        self.assertEqual(option_root_get(options, 'foo.bar'), 'baz')
+        self.assertEqual(option_root_get(options, 'foo.root', root_options=root_options), 'baz_root')
+
     def test_options_defined(self):
         # Cannot create key when there are defined options
         with self.assertRaises(OptionError):
@@ -80,10 +108,6 @@ class TestOptions(unittest.TestCase):
         self.assertIsInstance(option_root_get(opt, 'foo.bar'), HelperStr)
 
     def test_options_value(self):
-        class TOptionValue(OptionValue):
-            def get_value(self, name: Optional[str] = None, base_option: Optional[Option] = None) -> Any:
-                return 'baz_value'
-
         opt = OptionsBase(defined_options={
             'foo': {
                 'bar': OptionDef(default_value='baz'),
@@ -106,6 +130,10 @@ class TestOptions(unittest.TestCase):
             }
         })
         self.assertEqual(option_root_get(opt, 'foo.bar'), 'baz')
+        self.assertIsInstance(opt.value_get('foo.bar'), OptionDefaultValue)
+
+        opt.defined_options['foo']['bar'].default_value = 'changed'
+        self.assertEqual(option_root_get(opt, 'foo.bar'), 'changed')
 
     def test_options_value_callable(self):
         opt = OptionsBase(defined_options={
@@ -203,3 +231,92 @@ class TestOptions(unittest.TestCase):
             }
         })
         self.assertEqual(option_root_get(opt, 'foo.bar'), {'gin': 1})
+
+    def test_options_dotted_key(self):
+        opt = OptionsBase(defined_options={
+            'foo': {
+                'bar.baz': OptionDef(default_value='gin'),
+                'bar': {
+                    'baz': OptionDef(default_value='per'),
+                },
+            }
+        })
+        self.assertEqual(option_root_get(opt, 'foo.bar.baz'), 'per')
+        with self.assertRaises(OptionError):
+            option_root_get(opt, 'foo.bar.per')
+
+    def test_options_define_per_instance(self):
+        opt = TOptions()
+        opt.defined_options['foo']['bar'].default_value = 'changed'
+        self.assertEqual(option_root_get(opt, 'foo.bar'), 'changed')
+
+        opt2 = TOptions()
+        self.assertIsNot(opt2.defined_options['foo']['bar'], opt.defined_options['foo']['bar'])
+        self.assertEqual(option_root_get(opt2, 'foo.bar'), 'baz')
+
+    def test_options_invalid_type(self):
+        opt = OptionsBase(defined_options=OptionDef(), options={})
+        with self.assertRaises(OptionError):
+            option_root_get(opt, 'foo')
+
+    def test_options_change_defined(self):
+        opt = OptionsBase(defined_options={
+            'foo': {
+                'bar': OptionDef(default_value='d'),
+            }
+        }, options={
+            'foo': {
+                'bar': 'x',
+            }
+        })
+        opt.options['foo']['bar'] = 'y'
+        self.assertEqual(option_root_get(opt, 'foo.bar'), 'y')
+
+    def test_options_set_defined_options(self):
+        opt = OptionsBase(defined_options={
+            'foo': {
+                'bar': OptionDef(default_value='baz'),
+            }
+        })
+        opt.defined_options = {
+            'foo': {
+                'bar': OptionDef(default_value='gin'),
+            }
+        }
+        self.assertEqual(option_root_get(opt, 'foo.bar'), 'gin')
+
+    def test_options_change_options(self):
+        opt = Options({
+            'foo': {
+                'bar': 'baz',
+            }
+        })
+        opt.options['foo']['bar'] = 'changed'
+        self.assertEqual(opt.value_get('foo.bar'), 'changed')
+
+    def test_options_set_options(self):
+        opt = Options({
+            'foo': {
+                'bar': 'baz',
+            }
+        })
+        self.assertEqual(opt.value_get('foo.bar'), 'baz')
+        opt.options = {
+            'foo': {
+                'bar': 'gin',
+            }
+        }
+        self.assertEqual(opt.value_get('foo.bar'), 'gin')
+        self.assertEqual(opt.value_get('foo'), {'bar': 'gin'})
+
+        opt_defined = TOptions({
+            'foo': {
+                'bar': 'per',
+            }
+        })
+        opt_defined.options = {
+            'foo': {
+                'bar': 'gin',
+            }
+        }
+        self.assertEqual(option_root_get(opt_defined, 'foo.bar'), 'gin')
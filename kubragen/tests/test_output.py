@@ -0,0 +1,119 @@
+import unittest
+
+import yaml
+
+from kubragen import KubraGen
+from kubragen.data import ValueData
+from kubragen.helper import QuotedStr, SingleQuotedStr, DoubleQuotedStr, FoldedStr, LiteralStr
+from kubragen.object import Object
+from kubragen.output import OutputProject, OutputDriver, OutputFile_ShellScript, OutputFile_Kubernetes, \
+    OutputFile_Yaml, OD_FileTemplate, OD_Raw
+from kubragen.provider import Provider_Generic
+from kubragen.yaml import YamlGenerator
+
+
+class OutputDriver_Memory(OutputDriver):
+    def __init__(self):
+        self.files = []
+
+    def write_file(self, file, filename, filecontents) -> None:
+        self.files.append((filename, filecontents))
+
+
+class TestOutput(unittest.TestCase):
+    def setUp(self):
+        self.kg = KubraGen(provider=Provider_Generic())
+
+    def create_project(self):
+        out = OutputProject(self.kg)
+
+        shell_script = OutputFile_ShellScript('create.sh')
+        out.append(shell_script)
+
+        file_kubernetes = OutputFile_Kubernetes('app.yaml')
+        file_kubernetes.append(OD_Raw('# app'))
+        file_kubernetes.append([
+            Object({
+                'kind': 'ConfigMap',
+                'data': {
+                    'value': QuotedStr('x'),
+                    'enabled': ValueData('y', enabled=True),
+                    'disabled': ValueData('z', enabled=False),
+                },
+            }, name='config'),
+        ])
+        file_kubernetes.append({'kind': 'Service'})
+        out.append(file_kubernetes)
+
+        file_yaml = OutputFile_Yaml('config.yaml', is_sequence=False)
+        file_yaml.append({'foo': 'bar'})
+        out.append(file_yaml)
+
+        shell_script.append(OD_FileTemplate('kubectl apply -f ${FILE_' + file_kubernetes.fileid + '}'))
+        shell_script.append(OD_FileTemplate('cat ${FILE_' + file_yaml.fileid + '}'))
+        return out
+
+    def test_output(self):
+        driver = OutputDriver_Memory()
+        self.create_project().output(driver)
+
+        self.assertEqual(driver.files, [
+            ('001-app.yaml', "# app\nkind: ConfigMap\ndata:\n  value: 'x'\n  enabled: y\n\n---\nkind: Service\n"),
+            ('create.sh', '#!/bin/bash\n\nkubectl apply -f 001-app.yaml\ncat config.yaml\n'),
+            ('config.yaml', 'foo: bar\n'),
+        ])
+
+    def test_output_skip_empty(self):
+        file_yaml = OutputFile_Yaml('config.yaml')
+        file_yaml.append({'foo': 'bar'})
+        file_yaml.append([])
+        file_yaml.append(None)
+        file_yaml.append({'foo': 'baz'})
+
+        file_kubernetes = OutputFile_Kubernetes('app.yaml')
+        file_kubernetes.append({'kind': 'ConfigMap'})
+        file_kubernetes.append([])
+        file_kubernetes.append({'kind': 'Service'})
+
+        out = OutputProject(self.kg)
+        out.append(file_yaml)
+        out.append(file_kubernetes)
+        driver = OutputDriver_Memory()
+        out.output(driver)
+
+        self.assertEqual(driver.files, [
+            ('001-config.yaml', 'foo: bar\n\n---\nfoo: baz\n'),
+            ('002-app.yaml', 'kind: ConfigMap\n\n---\nkind: Service\n'),
+        ])
+
+    def test_output_string_styles(self):
+        self.assertEqual(YamlGenerator(self.kg).generate({
+            'quoted': QuotedStr('x'),
+            'single': SingleQuotedStr("it's"),
+            'double': DoubleQuotedStr('say "x"'),
+            'folded': FoldedStr('first line\nsecond line\n'),
+            'literal': LiteralStr('first line\nsecond line\n'),
+        }), '''quoted: 'x'
+single: 'it''s'
+double: "say \\"x\\""
+folded: >
+  first line
+
+  second line
+literal: |
+  first line
+  second line
+''')
+
+    def test_output_string_styles_long(self):
+        # the libyaml and Python emitters break long quoted lines differently, only the style is kept
+        value = ' '.join(['lorem ipsum dolor sit amet'] * 5)
+        data = {
+            'double': DoubleQuotedStr(value),
+            'folded': FoldedStr(value + '\n'),
+        }
+        output = YamlGenerator(self.kg).generate(data)
+
+        self.assertRegex(output, '(?m)^double: "')
+        self.assertRegex(output, '(?m)^folded: >$')
+        self.assertEqual(yaml.safe_load(output), data)
@@ -1,6 +1,8 @@
 import unittest
 
-from kubragen.provider import Provider_Generic
+import semver  # type: ignore
+
+from kubragen.provider import Provider_Generic, ProviderGenericShared
 
 
 class TestProvider(unittest.TestCase):
@@ -8,3 +10,32 @@ class TestProvider(unittest.TestCase):
     def test_secret_encode(self):
         provider = Provider_Generic()
         self.assertEqual(provider.secret_data_encode('kubragen'), 'a3VicmFnZW4=')
+
+    def test_secret_encode_many(self):
+        provider = Provider_Generic()
+        datas = ['kubragen', b'', b'a', 'ab', 'abc', b'\x00\xff', 'secret-value-é']
+        self.assertEqual(provider.secret_data_encode_many(datas),
+                         [provider.secret_data_encode(data) for data in datas])
+
+    def test_secret_encode_assume_encoded(self):
+        provider = Provider_Generic()
+        self.assertEqual(provider.secret_data_encode('a3VicmFnZW4=', assume_encoded=True), 'a3VicmFnZW4=')
+        self.assertEqual(provider.secret_data_encode('kubragen-1', assume_encoded=True), 'a3VicmFnZW4tMQ==')
+        self.assertEqual(provider.secret_data_encode('a3VicmFnZW4='), 'YTNWaWNtRm5aVzQ9')
+
+    def test_generic_shared(self):
+        self.assertIs(ProviderGenericShared(), ProviderGenericShared())
+        self.assertIsNot(ProviderGenericShared(), ProviderGenericShared('1.18.0'))
+        self.assertEqual(ProviderGenericShared('1.18.0').kubernetes_version, '1.18.0')
+        self.assertIs(ProviderGenericShared('1.18.0'), ProviderGenericShared(kubernetes_version='1.18.0'))
+        self.assertIs(ProviderGenericShared(), ProviderGenericShared('1.19.0'))
+        self.assertIs(ProviderGenericShared(semver.VersionInfo.parse('1.18.0')), ProviderGenericShared('1.18.0'))
+
+    def test_secret_encode_bytes(self):
+        provider = Provider_Generic()
+        self.assertEqual(provider.secret_data_encode(b'kubragen'), 'a3VicmFnZW4=')
+        self.assertEqual(provider.secret_data_encode_bytes(b'kubragen'), b'a3VicmFnZW4=')
+
+    def test_secret_encode_non_ascii(self):
+        provider = Provider_Generic()
+        self.assertEqual(provider.secret_data_encode('kubragén'), 'a3VicmFnw6lu')
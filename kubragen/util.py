@@ -1,20 +1,26 @@
-from typing import Mapping, Any, Sequence, Optional, MutableMapping, List
+import functools
+from typing import Mapping, Any, Sequence, Optional, MutableMapping, Dict, Tuple
 
 from .exception import OptionError
 
 
+_MISSING = object()
+
+_OPTION_NOT_FOUND = 'Could not find option "{}"'
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_name(name: str) -> Tuple[str, ...]:
+    return tuple(name.split('.'))
+
+
 def dict_has_name(dict: Mapping, name: str) -> bool:
     """Checks if the dict has a name using a dotted accessor-string
 
     :param dict: source dictionary
     :param name: dotted value name
     """
-    current_data = dict
-    for chunk in name.split('.'):
-        if chunk not in current_data:
-            return False
-        current_data = current_data.get(chunk, {})
-    return True
+    return dict_try_get(dict, name, _MISSING) is not _MISSING
 
 
 def dict_get_value(dict: Mapping, name: str) -> Any:
@@ -24,12 +30,34 @@ def dict_get_value(dict: Mapping, name: str) -> Any:
     :param name: dotted value name
     """
     current_data = dict
-    for chunk in name.split('.'):
-        if not isinstance(current_data, (Mapping, Sequence)):
-            raise OptionError('Could not find option "{}"'.format(name))
+    for chunk in _split_name(name):
+        if type(current_data) is not dict and not isinstance(current_data, (Mapping, Sequence)):
+            raise OptionError(_OPTION_NOT_FOUND.format(name))
         if chunk not in current_data:
-            raise OptionError('Could not find option "{}"'.format(name))
-        current_data = current_data.get(chunk, {})
+            raise OptionError(_OPTION_NOT_FOUND.format(name))
+        current_data = current_data[chunk]
+    return current_data
+
+
+def dict_try_get(dict: Mapping, name: str, default: Any = None) -> Any:
+    """Gets data from a dictionary using a dotted accessor-string, or a default value if not found
+
+    :param dict: source dictionary
+    :param name: dotted value name
+    :param default: the value to return if the name is not found
+    """
+    current_data = dict
+    for chunk in _split_name(name):
+        if type(current_data) is dict:
+            # plain dicts don't have side effects on missing keys, like defaultdict
+            try:
+                current_data = current_data[chunk]
+            except KeyError:
+                return default
+        elif isinstance(current_data, Mapping) and chunk in current_data:
+            current_data = current_data[chunk]
+        else:
+            return default
     return current_data
 
 
@@ -37,14 +65,20 @@ def dict_flatten(d, parent_key='', sep='.') -> Mapping:
     """
     Flatten a dict to a single level.
     """
-    items: List[Any] = []
-    for k, v in d.items():
-        new_key = parent_key + sep + k if parent_key else k
-        if isinstance(v, MutableMapping):
-            items.extend(dict_flatten(v, new_key, sep=sep).items())
+    ret: Dict[str, Any] = {}
+    # depth-first using a stack of item iterators, so the keys keep the same order as a recursive walk
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f'{prefix}{sep}{k}' if prefix else k
+            if type(v) is dict or isinstance(v, MutableMapping):
+                stack.append((new_key, iter(v.items())))
+                break
+            ret[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    return ret
 
 
 def urljoin(*args: str) -> str:
@@ -54,7 +88,7 @@ def urljoin(*args: str) -> str:
     :param args: list of strings to join
     :return: joined strings
     """
-    return "/".join(map(lambda x: str(x).rstrip('/'), args))
+    return "/".join(str(x).rstrip('/') for x in args)
 
 
 def type_name(t) -> str:
@@ -63,13 +97,10 @@ def type_name(t) -> str:
     :param t: value to get type if
     :return: the type name
     """
-    if not isinstance(t, type):
-        t = type(t)
-
-    # if isinstance(t, type):
-    #     raise TypeError('T is "type"')
-
-    return getattr(t, '__name__', repr(t))
+    if isinstance(t, type):
+        return t.__name__
+    # type() always returns a class, which always has a name
+    return type(t).__name__
 
 
 def is_allowed_types(value: Any, allowed_types: Optional[Sequence[Any]], required: Optional[bool] = None) -> bool:
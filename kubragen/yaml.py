@@ -1,3 +1,4 @@
+import functools
 from typing import Optional, Dict, Any
 
 import yaml
@@ -11,6 +12,12 @@ from .option import OptionDef
 from .private.yaml import represent_single_quoted_str, represent_double_quoted_str, represent_folded_str, \
     represent_literal_str
 
+try:
+    # libyaml based emitter, much faster for big documents
+    from yaml import CDumper as _Dumper
+except ImportError:  # pragma: no cover
+    from yaml import Dumper as _Dumper  # type: ignore
+
 
 def YamlDumper(kg: KubraGen):
     """
@@ -24,27 +31,26 @@ def YamlDumper(kg: KubraGen):
     return k
 
 
-class YamlDumperBase(yaml.Dumper):
+class YamlDumperBase(_Dumper):
     """
     YAML dumper that takes KubraGen HelperStr classes in account.
-    """
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
 
+    If PyYAML was built with libyaml, its C emitter is used.
+    The HelperStr representers are registered on the class, once.
+    """
+    def ignore_aliases(self, data):
         # https://stackoverflow.com/questions/51272814/python-yaml-dumping-pointer-references
-        self.ignore_aliases = lambda *args: True
+        return True
 
-        # String
-        self.add_representer(SingleQuotedStr, represent_single_quoted_str)
-        self.add_representer(DoubleQuotedStr, represent_double_quoted_str)
-        self.add_representer(FoldedStr, represent_folded_str)
-        self.add_representer(LiteralStr, represent_literal_str)
 
-        # QuotedStr
-        self._init_quotedstr()
+# String
+YamlDumperBase.add_representer(SingleQuotedStr, represent_single_quoted_str)
+YamlDumperBase.add_representer(DoubleQuotedStr, represent_double_quoted_str)
+YamlDumperBase.add_representer(FoldedStr, represent_folded_str)
+YamlDumperBase.add_representer(LiteralStr, represent_literal_str)
 
-    def _init_quotedstr(self):
-        self.add_representer(QuotedStr, represent_single_quoted_str)
+# QuotedStr
+YamlDumperBase.add_representer(QuotedStr, represent_single_quoted_str)
 
 
 class YamlDumperImpl(YamlDumperBase):
@@ -59,50 +65,49 @@ class YamlDumperImpl(YamlDumperBase):
         self.kg = kg
         super().__init__(*args, **kwargs)
 
-        # KGObject
-        def kgobject_representer(dumper: yaml.Dumper, data: Object):
-            return dumper.represent_dict(data)
-        self.add_representer(Object, kgobject_representer)
-
-        # KGOptionDef
-        def kgoptiondef_representer(dumper: yaml.Dumper, data: OptionDef):
-            raise KGException('KGOptionDef cannot be output in yaml')
-            # return dumper.represent(data.default_value)
-        self.add_representer(OptionDef, kgoptiondef_representer)
-
-        # KGData
-        def kgdata_representer(dumper: yaml.Dumper, data: Data):
-            if not data.is_enabled():
-                return dumper.represent_none(None)
-            return dumper.represent_data(data.get_value())
-        self.add_multi_representer(Data, kgdata_representer)
-
     def represent_sequence(self, tag, sequence, flow_style=None):
-        kgsequence = []
-        for item in sequence:
-            if isinstance(item, Data) and not item.is_enabled():
-                continue
-            kgsequence.append(item)
+        kgsequence = [item for item in sequence
+                      if not (isinstance(item, Data) and not item.is_enabled())]
         return super().represent_sequence(tag, kgsequence, flow_style)
 
     def represent_mapping(self, tag, mapping, flow_style=None):
-        kgmapping = {}
         if hasattr(mapping, 'items'):
-            mapping = list(mapping.items())
-        for item_key, item_value in mapping:
-            if isinstance(item_value, Data) and not item_value.is_enabled():
-                continue
-            kgmapping[item_key] = item_value
+            mapping = mapping.items()
+        kgmapping = {item_key: item_value for item_key, item_value in mapping
+                     if not (isinstance(item_value, Data) and not item_value.is_enabled())}
         return super().represent_mapping(tag, kgmapping, flow_style=False)
 
-    def _init_quotedstr(self):
-        # QuotedStr
-        def kgvaluequotedstr_representer(dumper: yaml.Dumper, data: QuotedStr):
-            if self.kg is not None:
-                if not self.kg.default_quoted_value_single():
-                    return represent_double_quoted_str(dumper, data)
-            return represent_single_quoted_str(dumper, data)
-        self.add_representer(QuotedStr, kgvaluequotedstr_representer)
+
+# KGObject
+def _kgobject_representer(dumper: YamlDumperImpl, data: Object):
+    return dumper.represent_dict(data)
+
+
+# KGOptionDef
+def _kgoptiondef_representer(dumper: YamlDumperImpl, data: OptionDef):
+    raise KGException('KGOptionDef cannot be output in yaml')
+    # return dumper.represent(data.default_value)
+
+
+# KGData
+def _kgdata_representer(dumper: YamlDumperImpl, data: Data):
+    if not data.is_enabled():
+        return dumper.represent_none(None)
+    return dumper.represent_data(data.get_value())
+
+
+# QuotedStr
+def _kgvaluequotedstr_representer(dumper: YamlDumperImpl, data: QuotedStr):
+    if dumper.kg is not None:
+        if not dumper.kg.default_quoted_value_single():
+            return represent_double_quoted_str(dumper, data)
+    return represent_single_quoted_str(dumper, data)
+
+
+YamlDumperImpl.add_representer(Object, _kgobject_representer)
+YamlDumperImpl.add_representer(OptionDef, _kgoptiondef_representer)
+YamlDumperImpl.add_multi_representer(Data, _kgdata_representer)
+YamlDumperImpl.add_representer(QuotedStr, _kgvaluequotedstr_representer)
 
 
 class YamlGenerator:
@@ -115,6 +120,7 @@ class YamlGenerator:
 
     def __init__(self, kg: KubraGen):
         self.kg = kg
+        self._dumper = functools.partial(YamlDumperImpl, kg=kg)
 
     def generate(self, data) -> str:
         """
@@ -125,5 +131,5 @@ class YamlGenerator:
         """
         yaml_dump_params: Dict[Any, Any] = {'default_flow_style': None, 'sort_keys': False}
         if isinstance(data, list):
-            return yaml.dump_all(data, Dumper=YamlDumper(self.kg), **yaml_dump_params)
-        return yaml.dump(data, Dumper=YamlDumper(self.kg), **yaml_dump_params)
+            return yaml.dump_all(data, Dumper=self._dumper, **yaml_dump_params)
+        return yaml.dump(data, Dumper=self._dumper, **yaml_dump_params)
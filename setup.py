@@ -1,12 +1,21 @@
+import ast
 import pathlib
-import re
 
 import setuptools
 
-__version__ = re.search(
-    r'__version__\s*=\s*[\'"]([^\'"]*)[\'"]',  # It excludes inline comment too
-    open('kubragen/__init__.py', encoding='utf_8_sig').read()
-    ).group(1)
+
+def _read_version(filename):
+    # parse instead of import, the package dependencies may not be installed yet
+    with open(filename, encoding='utf_8_sig') as fh:
+        tree = ast.parse(fh.read(), filename)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and \
+                any(isinstance(target, ast.Name) and target.id == '__version__' for target in node.targets):
+            return ast.literal_eval(node.value)
+    raise RuntimeError('__version__ not found in {}'.format(filename))
+
+
+__version__ = _read_version('kubragen/__init__.py')
 
 HERE = pathlib.Path(__file__).parent
 INSTALL_REQUIRES = (HERE / "requirements.txt").read_text().splitlines()